@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from Utils import WindowsButton, WindowsCheckbox, MacButton, MacCheckbox
+from Utils import Button, Checkbox
 
 class GUIFactory(ABC):
 
@@ -13,20 +13,20 @@ class GUIFactory(ABC):
 
 class WindowsFactory(GUIFactory):
 
-    def create_button(self):
-        return WindowsButton()
+    def create_button(self): #widgets carry their own active state, so every call returns a new one.
+        return Button('windows')
 
     def create_checkbox(self):
-        return WindowsCheckbox()
+        return Checkbox('windows')
 
 
 class MacFactory(GUIFactory):
 
     def create_button(self):
-        return MacButton()
+        return Button('mac')
 
     def create_checkbox(self):
-        return MacCheckbox()
+        return Checkbox('mac')
 
 
 
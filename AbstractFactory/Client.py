@@ -1,13 +1,18 @@
-from AbstractFactory import WindowsFactory, MacFactory
+from functools import lru_cache
+from AbstractFactory import GUIFactory, WindowsFactory, MacFactory
 from Utils import OSType
 
 os = OSType.Mac #usually it comes from config file of the system
 
+@lru_cache(maxsize=4)
+def get_factory(os: OSType) -> GUIFactory: #factory is built only once per OS.
+    return {OSType.Mac: MacFactory, OSType.Windows: WindowsFactory}.get(os, WindowsFactory)()
+
 if __name__ == "__main__":
 
-    gui_factory = MacFactory() if os == OSType.Mac else WindowsFactory()
+    gui_factory = get_factory(os)
 
     button = gui_factory.create_button()
     checkbox = gui_factory.create_checkbox()
     button.render()
-    checkbox.render() 
\ No newline at end of file
+    checkbox.render()
\ No newline at end of file
@@ -1,9 +1,16 @@
-from abc import ABC, abstractmethod
 
-class Button(ABC):
+class Button():
 
-    def __init__(self,state = False):
-        self.state = False
+    __slots__ = ('kind', 'state')
+
+    _RENDER = {
+        'windows': "Windows Button is rendering",
+        'mac': "Mac Button is rendering",
+    }
+
+    def __init__(self, kind, state = False): #kind picks the platform look and feel, e.g. 'windows' or 'mac'.
+        self.kind = kind
+        self.state = state
 
     def is_active(self):
         return self.state == True
@@ -11,16 +18,5 @@ class Button(ABC):
     def set_active(self,state):
         self.state = state
 
-    @abstractmethod
-    def render(self):
-        pass
-
-class WindowsButton(Button):
-    
-    def render(self):
-        print("Windows Button is rendering")
-
-class MacButton(Button):
-    
     def render(self):
-        print("Mac Button is rendering")
\ No newline at end of file
+        print(self._RENDER[self.kind])
@@ -1,9 +1,16 @@
-from abc import ABC, abstractmethod
 
-class Checkbox(ABC):
+class Checkbox():
 
-    def __init__(self,state = False):
-        self.state = False
+    __slots__ = ('kind', 'state')
+
+    _RENDER = {
+        'windows': "Windows Checkbox is rendering",
+        'mac': "Mac Checkbox is rendering",
+    }
+
+    def __init__(self, kind, state = False):
+        self.kind = kind
+        self.state = state
 
     def is_active(self):
         return self.state == True
@@ -11,16 +18,5 @@ class Checkbox(ABC):
     def set_active(self,state):
         self.state = state
 
-    @abstractmethod
-    def render(self):
-        pass
-
-class WindowsCheckbox(Checkbox):
-    
-    def render(self):
-        print("Windows Checkbox is rendering")
-
-class MacCheckbox(Checkbox):
-    
     def render(self):
-        print("Mac Checkbox is rendering")
\ No newline at end of file
+        print(self._RENDER[self.kind])
@@ -1,4 +1,4 @@
 
-from .Button import MacButton, WindowsButton
-from .Checkbox import MacCheckbox, WindowsCheckbox
+from .Button import Button
+from .Checkbox import Checkbox
 from .OS import OSType
@@ -3,9 +3,12 @@ from .FileUploader import FileUploader
 
 class AzureBlobClientAdapter(FileUploader):
 
+    __slots__ = ('azure_client', '_upload')
+
     def __init__(self, client: AzureBlobClient):
         self.azure_client = client
+        self._upload = client.upload_blob
 
     def upload_file(self, bucket_id, file_name, data):
-        self.azure_client.upload_blob(bucket_id, file_name, data)
+        self._upload(bucket_id, file_name, data)
 
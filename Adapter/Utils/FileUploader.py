@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 class FileUploader(ABC): #its the uploader service we provided to the clients.
 
+    __slots__ = ()
+
     @abstractmethod
     def upload_file(self,file_name,data):
         pass
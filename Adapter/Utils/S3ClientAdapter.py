@@ -3,8 +3,11 @@ from .FileUploader import FileUploader
 
 class S3ClientAdapter(FileUploader):
 
+    __slots__ = ('s3_client', '_upload')
+
     def __init__(self, client: S3Client):
         self.s3_client = client
+        self._upload = client.put_object #bound once, saves an attribute lookup per upload.
 
     def upload_file(self, bucket_id, file_name, data):
-        self.s3_client.put_object(bucket_id, file_name, data)
+        self._upload(bucket_id, file_name, data)
@@ -1,13 +1,31 @@
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional
 
-class HttpRequest():
-    def __init__(self,url=""):
-        self.url = url
-        self.method = None
-        self.params = {}
-        self.headers = {}
-        self.timeout = 5
-        self.body = None
-    
-    def __str__(self):
-        return f"URL:{self.url} Method:{self.method} Headers:{self.headers} Param:{self.params} Body:{self.body} Timeout:{self.timeout}"
+class HttpRequest(NamedTuple): #immutable, the builder collects the fields and creates it in one go.
+
+    url: str = ""
+    method: Optional[str] = None
+    params: Mapping = MappingProxyType({})
+    headers: Mapping = MappingProxyType({})
+    timeout: int = 5
+    body: Any = None
+
+    _FMT = "URL:%s Method:%s Headers:%s Param:%s Body:%s Timeout:%s"
+
+    def _key(self):
+        return (self.url, self.method, frozenset(self.params.items()), frozenset(self.headers.items()), self.body, self.timeout)
 
+    def __eq__(self, other):
+        if not isinstance(other, HttpRequest):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self): #computed on demand, only hashing a request with unhashable values (e.g. a JSON body dict) fails.
+        return hash(self._key())
+
+    def __str__(self):
+        return self._FMT % (self.url, self.method, dict(self.headers), dict(self.params), self.body, self.timeout)
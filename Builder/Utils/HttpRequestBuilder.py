@@ -1,39 +1,44 @@
+from types import MappingProxyType
 from .HttpRequest import HttpRequest
 
 class HttpRequestBuilder():
 
     def __init__(self):
-        self.request = HttpRequest()
+        self.clean()
 
     def with_url(self,url):
-        self.request.url = url
+        self.url = url
         return self
     
     def with_header(self, key, value):
-        self.request.headers[key] = value
+        self.headers[key] = value
         return self
     
     def with_param(self, key, value):
-        self.request.params[key] = value
+        self.params[key] = value
         return self
 
     def with_body(self, content):
-        self.request.body = content
+        self.body = content
         return self
 
     def with_method(self,method):
-        self.request.method = method
+        self.method = method
         return self
 
     def with_timeout(self,timeout):
-        self.request.timeout = timeout
+        self.timeout = timeout
         return self
     
-    def build(self):
-        return self.request
+    def build(self): #the built request is an immutable snapshot, so it is safe to cache and reuse.
+        request = HttpRequest(self.url, self.method, MappingProxyType(self.params), MappingProxyType(self.headers), self.timeout, self.body)
+        self.clean()
+        return request
 
     def clean(self):
-        self.request = HttpRequest()
-
-
-    
\ No newline at end of file
+        self.url = ""
+        self.method = None
+        self.params = {}
+        self.headers = {}
+        self.timeout = 5
+        self.body = None
@@ -6,19 +6,23 @@ class FileCompressor(IFileRepository): #Compressing data before writing into fil
     def __init__(self, wrapee: IFileRepository):
         self.repo: IFileRepository = wrapee
 
-    def _compress_base64(self, data):
-        return f"$${data}$$"
+    def _compress_base64(self, data: bytes): #works on bytes so a real codec (e.g. zlib) can drop in without re-encoding.
+        return b"$$" + data + b"$$"
     
-    def _parse_base64(self, data):  
+    def _parse_base64(self, data: bytes):  
         return data[2:-2]
 
-    def write_file(self, file_name, data):
+    def write_file(self, file_name, data: bytes):
         data1 = data
         data = self._compress_base64(data)
-        print(f"[FileCompressor] {data1} compressed to {data}")
+        print(f"[FileCompressor] {self._display(data1)} compressed to {self._display(data)}")
         self.repo.write_file(file_name, data)
 
+    def _write_steps(self):
+        steps, base = self.repo._write_steps()
+        return [self._compress_base64] + steps, base
+
     def read_file(self, file_name):
         data = self.repo.read_file(file_name)
         data = self._parse_base64(data)
-        return f"data parsing is done. data::{data}"
\ No newline at end of file
+        return f"data parsing is done. data::{self._display(data)}"
\ No newline at end of file
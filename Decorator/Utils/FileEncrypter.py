@@ -6,21 +6,25 @@ class FileEncrypter(IFileRepository): #Providing encryption flexibility to the d
     def __init__(self, wrapee: IFileRepository):
         self.repo: IFileRepository = wrapee
 
-    def _encrypt_AES(self, data):
-        data = "# " + data + " #"
+    def _encrypt_AES(self, data: bytes): #works on bytes, which is what real AES implementations consume.
+        data = b"# " + data + b" #"
         return data
     
-    def _decrypt_AES(self, data):
+    def _decrypt_AES(self, data: bytes):
         data = data[1:-1]
         return data
 
-    def write_file(self, file_name, data):
+    def write_file(self, file_name, data: bytes):
         data = self._encrypt_AES(data)
-        print(f"[FileEncrypter] Encrypted data {data}")
+        print(f"[FileEncrypter] Encrypted data {self._display(data)}")
         self.repo.write_file(file_name, data)
 
+    def _write_steps(self):
+        steps, base = self.repo._write_steps()
+        return [self._encrypt_AES] + steps, base
+
 
     def read_file(self, file_name):
         data = self.repo.read_file(file_name)
         data = self._decrypt_AES(data)
-        return f"{file_name} file_contents {data}"
\ No newline at end of file
+        return f"{file_name} file_contents {self._display(data)}"
\ No newline at end of file
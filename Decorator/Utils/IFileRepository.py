@@ -3,9 +3,27 @@ from abc import ABC, abstractmethod
 class IFileRepository(ABC):
 
     @abstractmethod
-    def write_file(self, file_name, data):
+    def write_file(self, file_name, data: bytes):
         pass
 
     @abstractmethod
     def read_file(self, file_name):
-        pass
\ No newline at end of file
+        pass
+
+    @staticmethod
+    def _display(data): #file data is bytes, decoded only when it is shown as text.
+        return data.decode(errors='replace') if isinstance(data, bytes) else data
+
+    def _write_steps(self): #data transforms applied before writing (outermost first) and the repo doing the actual write.
+        return [], self
+
+    def compile(self): #collapses the decorator chain into a single write function, per layer logging is skipped.
+        steps, base = self._write_steps()
+        write = base.write_file
+
+        def fast_write(file_name, data):
+            for step in steps:
+                data = step(data)
+            write(file_name, data)
+
+        return fast_write
\ No newline at end of file
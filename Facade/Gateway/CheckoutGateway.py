@@ -1,5 +1,13 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from Service import InventoryService, CreditCardPaymentService, OrderService, EmailNotificationService, Order
 
+log = logging.getLogger(__name__)
+
+def _report_notification_failure(future: Future):
+    exc = future.exception()
+    if exc is not None:
+        log.error("Order notification failed", exc_info=exc)
 
 class CheckoutGateway():
 
@@ -8,14 +16,21 @@ class CheckoutGateway():
         self.payment_service = CreditCardPaymentService()
         self.order_service = OrderService()
         self.notification_service = EmailNotificationService()
+        self.executor = ThreadPoolExecutor(max_workers=2) #notifications are sent off the critical path.
 
     def place_order(self, order: Order):
         self.inventory_service.reserve_item(order)
         self.payment_service.pay_amount(order.price)
         self.order_service.place_order(order)
-        self.notification_service.send_notification(f"Order with {order.order_id} has been placed successfully.")
-
+        future = self.executor.submit(self.notification_service.send_notification, f"Order with {order.order_id} has been placed successfully.")
+        future.add_done_callback(_report_notification_failure) #nobody waits on the future, so failures are logged here.
+        return future
 
-        
+    def close(self): #waits for pending notifications and stops the worker threads.
+        self.executor.shutdown(wait=True)
 
+    def __enter__(self):
+        return self
 
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
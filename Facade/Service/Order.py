@@ -5,12 +5,12 @@ class Order_State(Enum):
     SUCCESS = 2
 
 class Order():
-    def __init__(self, order_id, order_name = "", order_type = "", item_list = [], price = 100):
+    def __init__(self, order_id, order_name = "", order_type = "", item_list = None, price = 100):
         self.order_id = order_id
         self.order_state = Order_State.PENDING
         self.order_name = order_name
         self.order_type = order_type
-        self.item_list = item_list
+        self.item_list = [] if item_list is None else item_list
         self.price = price
 
     def __str__(self):
@@ -1,27 +1,38 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import deque
+from operator import methodcaller
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict
 
 if TYPE_CHECKING:
     from Subscriber import User
 
 class Channel(ABC):
 
+    _EXECUTOR = ThreadPoolExecutor(max_workers=32) #shared by all channels that opt in to concurrent fan-out.
+
+    concurrent_notify = False #set True when subscribers do I/O (e.g. push over HTTP), delivery order is then not guaranteed.
+
     def __init__(self):
-        self.subscribers = []
+        self.subscribers: Dict[int, 'User'] = {} #keyed by id() so unsubscribe is a single lookup.
 
     def add_subsriber(self, subscriber: 'User'):
-        self.subscribers.append(subscriber)
+        self.subscribers[id(subscriber)] = subscriber
 
     def remove_subscriber(self, subscriber: 'User'):
-        self.subscribers.remove(subscriber)
+        self.subscribers.pop(id(subscriber), None)
 
     @abstractmethod
     def upload(self,video):
         pass
 
     def notify(self, message):
-        for subscriber in self.subscribers:
-            subscriber.notify(message)
+        subscribers = tuple(self.subscribers.values()) #snapshot, a subscriber may unsubscribe from inside its notify.
+        notify = methodcaller('notify', message)
+        if not self.concurrent_notify or len(subscribers) <= 1: #in-order and inline unless the pool can overlap I/O.
+            deque(map(notify, subscribers), maxlen=0)
+            return
+        deque(Channel._EXECUTOR.map(notify, subscribers), maxlen=0)
     
 
 
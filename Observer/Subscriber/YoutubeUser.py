@@ -1,9 +1,11 @@
+import sys
 from .User import User
 
 class YoutubeUser(User):
 
     def __init__(self,name):
         super().__init__(name)
+        self._prefix = f"{self} notified with " #built once instead of on every notification.
 
     def notify(self,message):
-        print(f"{self} notified with {message}")
\ No newline at end of file
+        sys.stdout.write(self._prefix + message + "\n") #single write, so lines from pooled notifications don't interleave.
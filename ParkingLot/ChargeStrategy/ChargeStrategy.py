@@ -4,4 +4,8 @@ class ChargeStrategy(ABC):
 
     @abstractmethod
     def calculate_charge(self,ticket):
-        pass
\ No newline at end of file
+        pass
+
+    def calculate_charges(self, tickets):
+        #bulk settlement, strategies can override this to share per-batch work such as reading the clock once.
+        return [self.calculate_charge(ticket) for ticket in tickets]
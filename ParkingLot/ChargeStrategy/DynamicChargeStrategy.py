@@ -1,26 +1,27 @@
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 if TYPE_CHECKING:
     from System import Ticket
 from .ChargeStrategy import ChargeStrategy
-from datetime import datetime
 from Enums import ParkingSlotType
 
 class DynamicChargeStrategy(ChargeStrategy):
 
     def __init__(self):
-        self.hourly_rate_map = {}
-        self.hourly_rate_map[ParkingSlotType.SMALL] = 20
-        self.hourly_rate_map[ParkingSlotType.MEDIUM] = 30
-        self.hourly_rate_map[ParkingSlotType.LARGE] = 40
+        #hourly rates indexed by ParkingSlotType.value, a list index is cheaper than hashing the enum.
+        self.rates = [0]*(max(slot_type.value for slot_type in ParkingSlotType)+1)
+        self.rates[ParkingSlotType.SMALL.value] = 20
+        self.rates[ParkingSlotType.MEDIUM.value] = 30
+        self.rates[ParkingSlotType.LARGE.value] = 40
 
     def calculate_charge(self, ticket: 'Ticket'):
         #calculation logic
-        cur_time = datetime.now()
-        issued_time = ticket.issued_time
-        diff_sec = cur_time - issued_time
-
-        diff_hrs = diff_sec.total_seconds()/3600
-        hourly_rate = self.hourly_rate_map[ticket.parking_slot_type]
+        diff_hrs = (time.time() - ticket.issued_ts)/3600
+        hourly_rate = self.rates[ticket.parking_slot_type.value]
         cost = round(diff_hrs * hourly_rate,2)
-        return cost
\ No newline at end of file
+        return cost
+
+    def calculate_charges(self, tickets: List['Ticket']):
+        cur_time = time.time()
+        rates = self.rates
+        return [round((cur_time - ticket.issued_ts)/3600 * rates[ticket.parking_slot_type.value],2) for ticket in tickets]
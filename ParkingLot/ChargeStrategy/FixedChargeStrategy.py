@@ -1,9 +1,8 @@
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 if TYPE_CHECKING:
     from System import Ticket
 from .ChargeStrategy import ChargeStrategy
-from datetime import datetime
 
 class FixedChargeStrategy(ChargeStrategy):
 
@@ -12,10 +11,11 @@ class FixedChargeStrategy(ChargeStrategy):
 
     def calculate_charge(self, ticket: 'Ticket'):
         #calculation logic
-        cur_time = datetime.now()
-        issued_time = ticket.issued_time
-        diff_sec = cur_time - issued_time
-        diff_sec = diff_sec.total_seconds()
-        diff_hrs = diff_sec/3600
+        diff_hrs = (time.time() - ticket.issued_ts)/3600
         cost = round(diff_hrs * self.hourly_rate,2)
-        return cost
\ No newline at end of file
+        return cost
+
+    def calculate_charges(self, tickets: List['Ticket']):
+        cur_time = time.time()
+        hourly_rate = self.hourly_rate
+        return [round((cur_time - ticket.issued_ts)/3600 * hourly_rate,2) for ticket in tickets]
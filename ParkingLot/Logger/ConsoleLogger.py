@@ -1,10 +1,8 @@
 from .Logger import Logger
-import threading
 
 class ConsoleLogger(Logger):
 
     instance = None
-    _lock = threading.Lock()
 
     def __init__(self):
         if ConsoleLogger.instance is not None:
@@ -12,11 +10,9 @@ class ConsoleLogger(Logger):
 
     @staticmethod
     def get_instance():
-        if ConsoleLogger.instance is None:
-            with ConsoleLogger._lock:
-                if ConsoleLogger.instance is None:
-                    ConsoleLogger.instance = ConsoleLogger()
         return ConsoleLogger.instance
 
     def log(self,message):
         print(message)
+
+ConsoleLogger.instance = ConsoleLogger() #eager init, the import lock makes this thread safe.
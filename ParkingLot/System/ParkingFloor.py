@@ -1,36 +1,49 @@
-import uuid
+import itertools
+from collections import defaultdict, deque
 from .ParkingSlot import ParkingSlot
 from Enums import ParkingSlotType, ParkingSlotState
-from typing import Dict
+from typing import Deque, Dict
 from Logger import ConsoleLogger
 from .TicketManager import TicketManager
 from datetime import datetime
 
+_floor_ids = itertools.count(1)
+
 class ParkingFloor():
 
     def __init__(self):
-        self.floor_id = str(uuid.uuid4())
-        self.slots:Dict[str, ParkingSlot] = {}
+        self.floor_id = next(_floor_ids)
+        self.slots:Dict[int, ParkingSlot] = {}
+        self._free_by_type:Dict[ParkingSlotType, Deque[ParkingSlot]] = defaultdict(deque) #candidate empty slots per type, re-checked on booking.
     
     def add_slot(self,slot:ParkingSlot):
         
         self.slots[slot.slot_id] = slot
+        slot.floor = self
+        self.slot_changed(slot)
+
+    def slot_changed(self, slot:ParkingSlot):
+        if slot.get_state() == ParkingSlotState.EMPTY: #may leave an older entry behind, book_slot skips those.
+            self._free_by_type[slot.get_type()].append(slot)
 
     def book_slot(self, vehicle_type:ParkingSlotType, vehicle_id, date: datetime):
-        empty_slots = [slot for slot in self.slots.values() if slot.get_type() == vehicle_type and slot.get_state() == ParkingSlotState.EMPTY]
-        if empty_slots:
-            slot = empty_slots[0]
+        free_slots = self._free_by_type[vehicle_type]
+        while free_slots:
+            slot = free_slots.popleft()
+            if slot.get_state() != ParkingSlotState.EMPTY or slot.get_type() != vehicle_type: #stale entry, slot changed since it was queued.
+                continue
             slot.set_state(ParkingSlotState.FILLED)
             return TicketManager.get_instance().create_ticket(vehicle_id,slot.get_id(), vehicle_type, date)
-            
-        else:
-            ConsoleLogger.get_instance().log("No slot available for the vehicle type")
-            return None
+
+        ConsoleLogger.get_instance().log("No slot available for the vehicle type")
+        return None
         
     
     def release_slot(self, slot_id):
-        if slot_id in self.slots.keys():
-            self.slots[slot_id].set_state(ParkingSlotState.EMPTY)
+        if slot_id in self.slots:
+            slot = self.slots[slot_id]
+            if slot.get_state() != ParkingSlotState.EMPTY:
+                slot.set_state(ParkingSlotState.EMPTY) #slot_changed puts it back in the free index.
             return True
         else:
             return False
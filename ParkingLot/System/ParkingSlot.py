@@ -1,23 +1,30 @@
 from Enums import ParkingSlotType, ParkingSlotState
-import uuid
+import itertools
+
+_slot_ids = itertools.count(1)
 
 class ParkingSlot():
     def __init__(self,slot_type: ParkingSlotType):
-        self.slot_id = str(uuid.uuid4())
+        self.slot_id = next(_slot_ids)
         self.parking_slot_type = slot_type
         self.parking_slot_state = ParkingSlotState.EMPTY
+        self.floor = None #set by ParkingFloor.add_slot, told about every type or state change.
     
     def get_id(self):
         return self.slot_id
     
     def set_type(self,slot_type):
         self.parking_slot_type = slot_type
+        if self.floor is not None:
+            self.floor.slot_changed(self)
     
     def get_type(self):
         return self.parking_slot_type
     
     def set_state(self,state):
         self.parking_slot_state = state
+        if self.floor is not None:
+            self.floor.slot_changed(self)
     
     def get_state(self):
         return self.parking_slot_state
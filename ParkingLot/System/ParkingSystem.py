@@ -13,21 +13,16 @@ import threading
 class ParkingSystem():
 
     instance = None
-    _lock = threading.Lock()
 
     @staticmethod
     def get_instance():
-        if ParkingSystem.instance is None:
-            with ParkingSystem._lock:
-                if ParkingSystem.instance is None:
-                    ParkingSystem.instance = ParkingSystem()
         return ParkingSystem.instance
     
     def __init__(self):
         if ParkingSystem.instance is not None:
             raise Exception("ParkingSystem is a singleton")
         self.id = str(uuid.uuid4())
-        self.floors: Dict[str, ParkingFloor] = {}
+        self.floors: Dict[int, ParkingFloor] = {}
         self.payment_strategy: ChargeStrategy = FixedChargeStrategy()
         self.instance_lock = threading.Lock()
     
@@ -55,10 +50,5 @@ class ParkingSystem():
                 return self.payment_strategy.calculate_charge(ticket)
             
         ConsoleLogger.get_instance().log(f"Invalid ticket got.")
-                
-
-    
-
-
-    
 
+ParkingSystem.instance = ParkingSystem() #eager init, same as ConsoleLogger.
@@ -1,15 +1,30 @@
-import uuid
+import itertools
+from typing import Dict
 from datetime import datetime
 
 from Logger import ConsoleLogger
 
+_ticket_ids = itertools.count(1)
+
 class Ticket():
-    def __init__(self,vehicle_number, parking_slot_id, slot_type, date = datetime.now()):
-        self.ticket_id = str(uuid.uuid4())
+
+    __slots__ = ('ticket_id', 'vehicle_number', 'parking_slot_id', 'parking_slot_type', '_issued_time', '_issued_ts')
+
+    def __init__(self,vehicle_number, parking_slot_id, slot_type, date = None):
+        self.ticket_id = next(_ticket_ids)
         self.vehicle_number = vehicle_number
         self.parking_slot_id = parking_slot_id
         self.parking_slot_type = slot_type
-        self.issued_time = date
+        self._issued_time = date if date is not None else datetime.now()
+        self._issued_ts = self._issued_time.timestamp() #epoch seconds, charge math is a plain float subtraction.
+
+    @property
+    def issued_time(self) -> datetime: #read-only, so it cannot drift from issued_ts.
+        return self._issued_time
+
+    @property
+    def issued_ts(self) -> float:
+        return self._issued_ts
     
     def __str__(self):
         return f"id: {self.ticket_id}, vehicle_number: {self.vehicle_number} and issued at :{self.issued_time}"
@@ -24,7 +39,7 @@ class TicketManager():
         return TicketManager.instance
 
     def __init__(self):
-        self.tickets = {}
+        self.tickets: Dict[int, Ticket] = {}
 
     def create_ticket(self, vehicle_number, parking_slot_id, slot_type, date):
         ticket = Ticket(vehicle_number, parking_slot_id, slot_type, date)
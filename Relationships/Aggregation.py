@@ -1,150 +1,226 @@
 # Aggregation: "I organize and manage you, but you can exist elsewhere"
 # Semantic essence: Organizational relationship with independent objects
 
+import logging
+import sys
+from collections.abc import Sequence
+
+log = logging.getLogger(__name__)
+
+def _intern(value):
+    """Interns repeated labels, anything that is not a str is kept as given"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+# Read-only view over an organizer's members, no copy per access and `in` uses the id() index
+class MembersView(Sequence):
+    __slots__ = ('_items', '_item_ids')
+
+    def __init__(self, items, item_ids):
+        self._items = items
+        self._item_ids = item_ids
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, item):
+        return id(item) in self._item_ids
+
+# Shared bookkeeping for every organizer below: ordered members plus an id() index
+class Organizer:
+    __slots__ = ('_items', '_item_ids', '_members')
+
+    def __init__(self):
+        self._items = []
+        self._item_ids = set()  # id() of each member, O(1) membership checks
+        self._members = MembersView(self._items, self._item_ids)
+
+    @property
+    def members(self):
+        """Members change only through the organizer's methods, which keep the id() index in step"""
+        return self._members
+
+    def _add(self, item):
+        """Returns True if the item was not organized here yet"""
+        if id(item) in self._item_ids:
+            return False
+        self._item_ids.add(id(item))
+        self._items.append(item)
+        return True
+
+    def _remove(self, item):
+        """Returns True if the item was organized here"""
+        if id(item) not in self._item_ids:
+            return False
+        self._item_ids.discard(id(item))
+        self._items.remove(item)
+        return True
+
 # AGGREGATION: Library → Book (library organizes books)
 class Book:
+    __slots__ = ('title', 'isbn', 'author')
+
     def __init__(self, title, isbn, author):
         self.title = title
         self.isbn = isbn
         self.author = author
         # Book exists independently of any library
 
-class Library:
+class Library(Organizer):
+    __slots__ = ('name', 'location')
+    books = Organizer.members  # Organizes existing books
+
     def __init__(self, name, location):
         self.name = name
         self.location = location
-        self.books = []  # Organizes existing books
+        super().__init__()
     
     def acquire_book(self, book):
         """Library organizes books that exist independently"""
-        if book not in self.books:
-            self.books.append(book)
-            print(f"Library acquired: {book.title}")
+        if self._add(book):
+            log.info("Library acquired: %s", book.title)
     
     def remove_book(self, book):
         """Book can be moved to another library"""
-        if book in self.books:
-            self.books.remove(book)
-            print(f"Book removed: {book.title}")
+        if self._remove(book):
+            log.info("Book removed: %s", book.title)
     
     def list_books(self):
-        print(f"{self.name} has {len(self.books)} books")
+        log.info("%s has %s books", self.name, len(self.books))
 
 # AGGREGATION: Team → Player (team organizes players)
 class Player:
+    __slots__ = ('name', 'position')
+
     def __init__(self, name, position):
         self.name = name
-        self.position = position
+        self.position = _intern(position)
         # Player exists independently of any team
 
-class Team:
+class Team(Organizer):
+    __slots__ = ('name', 'sport')
+    players = Organizer.members  # Organizes existing players
+
     def __init__(self, name, sport):
         self.name = name
         self.sport = sport
-        self.players = []  # Organizes existing players
+        super().__init__()
     
     def sign_player(self, player):
         """Team organizes players who exist independently"""
-        if player not in self.players:
-            self.players.append(player)
-            print(f"Team signed: {player.name}")
+        if self._add(player):
+            log.info("Team signed: %s", player.name)
     
     def release_player(self, player):
         """Player can join another team"""
-        if player in self.players:
-            self.players.remove(player)
-            print(f"Player released: {player.name}")
+        if self._remove(player):
+            log.info("Player released: %s", player.name)
     
     def list_roster(self):
-        print(f"{self.name} has {len(self.players)} players")
+        log.info("%s has %s players", self.name, len(self.players))
 
 # AGGREGATION: Playlist → Song (playlist organizes songs)
 class Song:
+    __slots__ = ('title', 'artist', 'duration')
+
     def __init__(self, title, artist, duration):
         self.title = title
-        self.artist = artist
+        self.artist = _intern(artist)
         self.duration = duration
         # Song exists independently of any playlist
 
-class Playlist:
+class Playlist(Organizer):
+    __slots__ = ('name', 'owner')
+    songs = Organizer.members  # Organizes existing songs
+
     def __init__(self, name, owner):
         self.name = name
         self.owner = owner
-        self.songs = []  # Organizes existing songs
+        super().__init__()
     
     def add_song(self, song):
         """Playlist organizes songs that exist independently"""
-        if song not in self.songs:
-            self.songs.append(song)
-            print(f"Added to playlist: {song.title}")
+        if self._add(song):
+            log.info("Added to playlist: %s", song.title)
     
     def remove_song(self, song):
         """Song can be in multiple playlists"""
-        if song in self.songs:
-            self.songs.remove(song)
-            print(f"Removed from playlist: {song.title}")
+        if self._remove(song):
+            log.info("Removed from playlist: %s", song.title)
     
     def play_playlist(self):
-        print(f"Playing {self.name} with {len(self.songs)} songs")
+        log.info("Playing %s with %s songs", self.name, len(self.songs))
 
 # AGGREGATION: Department → Employee (department organizes employees)
 class Employee:
+    __slots__ = ('name', 'emp_id', 'role')
+
     def __init__(self, name, emp_id, role):
         self.name = name
         self.emp_id = emp_id
-        self.role = role
+        self.role = _intern(role)
         # Employee exists independently of any department
 
-class Department:
+class Department(Organizer):
+    __slots__ = ('name', 'dept_code')
+    employees = Organizer.members  # Organizes existing employees
+
     def __init__(self, name, dept_code):
         self.name = name
         self.dept_code = dept_code
-        self.employees = []  # Organizes existing employees
+        super().__init__()
     
     def hire_employee(self, employee):
         """Department organizes employees who exist independently"""
-        if employee not in self.employees:
-            self.employees.append(employee)
-            print(f"Department hired: {employee.name}")
+        if self._add(employee):
+            log.info("Department hired: %s", employee.name)
     
     def transfer_employee(self, employee):
         """Employee can be transferred to another department"""
-        if employee in self.employees:
-            self.employees.remove(employee)
-            print(f"Employee transferred: {employee.name}")
+        if self._remove(employee):
+            log.info("Employee transferred: %s", employee.name)
     
     def list_staff(self):
-        print(f"{self.name} has {len(self.employees)} employees")
+        log.info("%s has %s employees", self.name, len(self.employees))
 
 # AGGREGATION: Portfolio → Stock (portfolio organizes stocks)
 class Stock:
+    __slots__ = ('symbol', 'company', 'price')
+
     def __init__(self, symbol, company, price):
-        self.symbol = symbol
+        self.symbol = _intern(symbol)
         self.company = company
         self.price = price
         # Stock exists independently in the market
 
-class Portfolio:
+class Portfolio(Organizer):
+    __slots__ = ('owner',)
+    stocks = Organizer.members  # Organizes existing stocks
+
     def __init__(self, owner):
         self.owner = owner
-        self.stocks = []  # Organizes existing stocks
+        super().__init__()
     
     def buy_stock(self, stock):
         """Portfolio organizes stocks that exist independently"""
-        if stock not in self.stocks:
-            self.stocks.append(stock)
-            print(f"Bought stock: {stock.symbol}")
+        if self._add(stock):
+            log.info("Bought stock: %s", stock.symbol)
     
     def sell_stock(self, stock):
         """Stock continues to exist in the market"""
-        if stock in self.stocks:
-            self.stocks.remove(stock)
-            print(f"Sold stock: {stock.symbol}")
+        if self._remove(stock):
+            log.info("Sold stock: %s", stock.symbol)
     
     def view_portfolio(self):
-        print(f"{self.owner}'s portfolio has {len(self.stocks)} stocks")
+        log.info("%s's portfolio has %s stocks", self.owner, len(self.stocks))
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     # Semantic test: Organization of independent objects
     
     # Library organizing books
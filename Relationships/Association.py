@@ -1,85 +1,101 @@
 # Association: "We are equal partners who collaborate"
 # Semantic essence: Mutual collaboration between independent equals
 
+import logging
+import sys
+
+log = logging.getLogger(__name__)
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _pair(a, a_links, b, b_links):
+    """Links a and b to each other in one step"""
+    a_links.add(b)
+    b_links.add(a)
+
 # ASSOCIATION: Doctor ↔ Patient (mutual professional relationship)
 class Doctor:
+    __slots__ = ('name', 'specialty', 'patients')
+
     def __init__(self, name, specialty):
         self.name = name
-        self.specialty = specialty
-        self.patients = []  # Collaborates with patients
+        self.specialty = _intern(specialty)
+        self.patients = set()  # Collaborates with patients
     
     def add_patient(self, patient):
-        if patient not in self.patients:
-            self.patients.append(patient)
-            patient.add_doctor(self)  # Mutual relationship
+        _pair(self, self.patients, patient, patient.doctors)  # Mutual relationship
     
     def treat_patient(self, patient):
         if patient in self.patients:
-            print(f"Dr. {self.name} treating {patient.name}")
+            log.info("Dr. %s treating %s", self.name, patient.name)
 
 class Patient:
+    __slots__ = ('name', 'condition', 'doctors')
+
     def __init__(self, name, condition):
         self.name = name
         self.condition = condition
-        self.doctors = []  # Collaborates with doctors
+        self.doctors = set()  # Collaborates with doctors
     
     def add_doctor(self, doctor):
-        if doctor not in self.doctors:
-            self.doctors.append(doctor)
+        self.doctors.add(doctor)
     
     def consult_doctor(self, doctor):
         if doctor in self.doctors:
-            print(f"{self.name} consulting with Dr. {doctor.name}")
+            log.info("%s consulting with Dr. %s", self.name, doctor.name)
 
 # ASSOCIATION: Author ↔ Book (collaborative creative relationship)
 class Author:
+    __slots__ = ('name', 'books')
+
     def __init__(self, name):
         self.name = name
-        self.books = []  # Collaborates in creating books
+        self.books = set()  # Collaborates in creating books
     
     def write_book(self, book):
-        if book not in self.books:
-            self.books.append(book)
-            book.add_author(self)  # Mutual relationship
+        _pair(self, self.books, book, book.authors)  # Mutual relationship
 
 class Book:
+    __slots__ = ('title', 'isbn', 'authors')
+
     def __init__(self, title, isbn):
         self.title = title
         self.isbn = isbn
-        self.authors = []  # Collaborates with authors
+        self.authors = set()  # Collaborates with authors
     
     def add_author(self, author):
-        if author not in self.authors:
-            self.authors.append(author)
+        self.authors.add(author)
 
 # ASSOCIATION: Student ↔ Course (academic collaboration)
 class Student:
+    __slots__ = ('name', 'student_id', 'courses')
+
     def __init__(self, name, student_id):
         self.name = name
         self.student_id = student_id
-        self.courses = []  # Collaborates in learning
+        self.courses = set()  # Collaborates in learning
     
     def enroll_in(self, course):
-        if course not in self.courses:
-            self.courses.append(course)
-            course.add_student(self)  # Mutual relationship
+        _pair(self, self.courses, course, course.students)  # Mutual relationship
     
     def attend_class(self, course):
         if course in self.courses:
-            print(f"{self.name} attending {course.name}")
+            log.info("%s attending %s", self.name, course.name)
 
 class Course:
+    __slots__ = ('name', 'code', 'students')
+
     def __init__(self, name, code):
         self.name = name
         self.code = code
-        self.students = []  # Collaborates in teaching
+        self.students = set()  # Collaborates in teaching
     
     def add_student(self, student):
-        if student not in self.students:
-            self.students.append(student)
+        self.students.add(student)
     
     def conduct_class(self):
-        print(f"Conducting {self.name} for {len(self.students)} students")
+        log.info("Conducting %s for %s students", self.name, len(self.students))
 
 # ASSOCIATION: Husband ↔ Wife (equal partnership)
 class Husband:
@@ -93,7 +109,7 @@ class Husband:
     
     def collaborate_with_wife(self, task):
         if self.wife:
-            print(f"{self.name} and {self.wife.name} working together on {task}")
+            log.info("%s and %s working together on %s", self.name, self.wife.name, task)
 
 class Wife:
     def __init__(self, name):
@@ -102,9 +118,10 @@ class Wife:
     
     def collaborate_with_husband(self, task):
         if self.husband:
-            print(f"{self.name} and {self.husband.name} working together on {task}")
+            log.info("%s and %s working together on %s", self.name, self.husband.name, task)
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     # Semantic test: Equal partners who collaborate
     
     # Doctor-Patient collaboration
@@ -1,8 +1,34 @@
 # Composition: "You exist because I created you - you are part of me"
 # Semantic essence: Creator-creation relationship with existential dependency
 
+import logging
+import sys
+import weakref
+
+log = logging.getLogger(__name__)
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+class WholeRef:
+    """Part -> whole back-reference held weakly, so deleting the whole frees it right away"""
+    def __set_name__(self, owner, name):
+        self.slot = '_' + name
+    
+    def __get__(self, part, owner=None):
+        if part is None:
+            return self
+        ref = getattr(part, self.slot)
+        return ref() if ref is not None else None
+    
+    def __set__(self, part, whole):
+        setattr(part, self.slot, weakref.ref(whole) if whole is not None else None)
+
 # COMPOSITION: Human → Organs (human creates and owns organs)
 class Heart:
+    __slots__ = ('blood_type', 'beats_per_minute', '_human')
+    human = WholeRef()
+
     def __init__(self, blood_type):
         self.blood_type = blood_type
         self.beats_per_minute = 72
@@ -10,9 +36,12 @@ class Heart:
     
     def beat(self):
         if self.human:
-            print(f"{self.human.name}'s heart is beating at {self.beats_per_minute} BPM")
+            return f"{self.human.name}'s heart is beating at {self.beats_per_minute} BPM"
 
 class Brain:
+    __slots__ = ('iq_level', 'thoughts', '_human')
+    human = WholeRef()
+
     def __init__(self, iq_level):
         self.iq_level = iq_level
         self.thoughts = []
@@ -21,7 +50,7 @@ class Brain:
     def think(self, thought):
         if self.human:
             self.thoughts.append(thought)
-            print(f"{self.human.name} is thinking: {thought}")
+            return f"{self.human.name} is thinking: {thought}"
 
 class Human:
     def __init__(self, name, blood_type, iq_level):
@@ -35,16 +64,19 @@ class Human:
         self.brain.human = self
     
     def live(self):
-        self.heart.beat()
-        self.brain.think("I am alive")
+        # Organs report back, the human emits everything in one record
+        log.info("%s\n%s", self.heart.beat(), self.brain.think("I am alive"))
     
     def __del__(self):
         print(f"{self.name} has died - organs stop functioning")
 
 # COMPOSITION: Car → Engine/Transmission (car creates and owns its parts)
 class Engine:
+    __slots__ = ('type', 'horsepower', '_car')
+    car = WholeRef()
+
     def __init__(self, engine_type, horsepower):
-        self.type = engine_type
+        self.type = _intern(engine_type)
         self.horsepower = horsepower
         self.car = None  # Belongs to exactly one car
     
@@ -53,15 +85,18 @@ class Engine:
             return f"{self.car.make} {self.car.model}'s {self.type} engine started"
 
 class Transmission:
+    __slots__ = ('type', 'gear', '_car')
+    car = WholeRef()
+
     def __init__(self, transmission_type):
-        self.type = transmission_type
+        self.type = _intern(transmission_type)
         self.gear = 1
         self.car = None  # Belongs to exactly one car
     
     def shift_gear(self, gear):
         if self.car:
             self.gear = gear
-            print(f"{self.car.make} shifted to gear {gear}")
+            return f"{self.car.make} shifted to gear {gear}"
 
 class Car:
     def __init__(self, make, model):
@@ -76,35 +111,52 @@ class Car:
         self.transmission.car = self
     
     def drive(self):
-        print(self.engine.start())
-        self.transmission.shift_gear(2)
+        log.info("%s\n%s", self.engine.start(), self.transmission.shift_gear(2))
     
     def __del__(self):
         print(f"{self.make} {self.model} scrapped - parts destroyed")
 
 # COMPOSITION: House → Rooms (house creates and owns rooms)
 class Room:
+    __slots__ = ('type', 'width', 'height', '_house', 'furniture')
+    house = WholeRef()
+
     def __init__(self, room_type, size):
-        self.type = room_type
-        self.size = size
+        self.type = _intern(room_type)
+        self.size = size  # Parsed once into plain int width/height
         self.house = None  # Belongs to exactly one house
         self.furniture = []
     
-    def add_furniture(self, item):
+    @property
+    def size(self):
+        return f"{self.width}x{self.height}"
+
+    @size.setter
+    def size(self, size):
+        width, height = size.split('x')
+        self.width = int(width)
+        self.height = int(height)
+
+    @property
+    def area(self):
+        return self.width * self.height
+    
+    def add_furniture(self, *items):
         if self.house:
-            self.furniture.append(item)
-            print(f"Added {item} to {self.type} in house at {self.house.address}")
+            self.furniture.extend(items)
+            if log.isEnabledFor(logging.INFO):
+                log.info("\n".join(f"Added {item} to {self.type} in house at {self.house.address}" for item in items))
 
 class House:
     def __init__(self, address):
         self.address = address
         # House creates its rooms - they cannot exist without house
-        self.rooms = [
+        self.rooms = (
             Room("Living Room", "20x15"),
             Room("Kitchen", "12x10"),
             Room("Master Bedroom", "15x12"),
             Room("Bathroom", "8x6")
-        ]
+        )  # Fixed at creation, a tuple avoids list over-allocation
         
         # Set ownership - rooms belong exclusively to this house
         for room in self.rooms:
@@ -114,22 +166,20 @@ class House:
         """House creates new rooms - they are part of this house"""
         new_room = Room(room_type, size)
         new_room.house = self
-        self.rooms.append(new_room)
+        self.rooms = (*self.rooms, new_room)
         return new_room
     
     def get_total_area(self):
-        total = 0
-        for room in self.rooms:
-            # Parse size like "20x15" to calculate area
-            dimensions = room.size.split('x')
-            total += int(dimensions[0]) * int(dimensions[1])
-        return total
+        return sum(room.area for room in self.rooms)
     
     def __del__(self):
         print(f"House at {self.address} demolished - all rooms destroyed")
 
 # COMPOSITION: Document → Pages (document creates and owns pages)
 class Page:
+    __slots__ = ('page_number', 'content', '_document')
+    document = WholeRef()
+
     def __init__(self, page_number):
         self.page_number = page_number
         self.content = ""
@@ -138,17 +188,17 @@ class Page:
     def add_content(self, text):
         if self.document:
             self.content += text
-            print(f"Added content to page {self.page_number} of '{self.document.title}'")
+            log.info("Added content to page %s of '%s'", self.page_number, self.document.title)
 
 class Document:
     def __init__(self, title):
         self.title = title
         # Document creates its pages - they cannot exist without document
-        self.pages = [
+        self.pages = (
             Page(1),
             Page(2),
             Page(3)
-        ]
+        )
         
         # Set ownership - pages belong exclusively to this document
         for page in self.pages:
@@ -159,20 +209,20 @@ class Document:
         new_page_number = len(self.pages) + 1
         new_page = Page(new_page_number)
         new_page.document = self
-        self.pages.append(new_page)
+        self.pages = (*self.pages, new_page)
         return new_page
     
     def get_total_content(self):
-        total_content = ""
-        for page in self.pages:
-            total_content += page.content + " "
-        return total_content.strip()
+        return " ".join(page.content for page in self.pages).strip()
     
     def __del__(self):
         print(f"Document '{self.title}' deleted - all pages destroyed")
 
 # COMPOSITION: Company → Departments (company creates and owns departments)
 class CompanyDepartment:
+    __slots__ = ('name', 'budget', '_company', 'projects')
+    company = WholeRef()
+
     def __init__(self, name, budget):
         self.name = name
         self.budget = budget
@@ -182,17 +232,17 @@ class CompanyDepartment:
     def start_project(self, project_name):
         if self.company:
             self.projects.append(project_name)
-            print(f"{self.name} dept at {self.company.name} started project: {project_name}")
+            log.info("%s dept at %s started project: %s", self.name, self.company.name, project_name)
 
 class Company:
     def __init__(self, name):
         self.name = name
         # Company creates its departments - they cannot exist without company
-        self.departments = [
+        self.departments = (
             CompanyDepartment("Engineering", 1000000),
             CompanyDepartment("Marketing", 500000),
             CompanyDepartment("Sales", 750000)
-        ]
+        )
         
         # Set ownership - departments belong exclusively to this company
         for dept in self.departments:
@@ -202,7 +252,7 @@ class Company:
         """Company creates new departments - they are part of this company"""
         new_dept = CompanyDepartment(name, budget)
         new_dept.company = self
-        self.departments.append(new_dept)
+        self.departments = (*self.departments, new_dept)
         return new_dept
     
     def get_total_budget(self):
@@ -212,6 +262,7 @@ class Company:
         print(f"Company {self.name} dissolved - all departments closed")
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     # Semantic test: Creator-creation relationship with existential dependency
     
     # Human creating organs
@@ -227,8 +278,7 @@ if __name__ == '__main__':
     # House creating rooms
     house = House("123 Main Street")
     living_room = house.rooms[0]
-    living_room.add_furniture("Sofa")
-    living_room.add_furniture("TV")
+    living_room.add_furniture("Sofa", "TV")
     
     # Add new room - created by house
     study = house.add_room("Study", "10x8")
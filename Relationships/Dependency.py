@@ -1,17 +1,20 @@
 # Dependency: "I consume your services temporarily"
 # Semantic essence: Service consumer relationship
 
-class EmailService:
-    @staticmethod
-    def send_email(to, subject, body):
-        print(f"📧 Sending email to {to}: {subject}")
-        return True
+import logging
+import sys
+from functools import lru_cache
 
-class SMSService:
-    @staticmethod
-    def send_sms(phone, message):
-        print(f"📱 Sending SMS to {phone}: {message}")
-        return True
+log = logging.getLogger(__name__)
+
+# Stateless services are plain module-level functions
+def send_email(to, subject, body):
+    log.info("📧 Sending email to %s: %s", to, subject)
+    return True
+
+def send_sms(phone, message):
+    log.info("📱 Sending SMS to %s: %s", phone, message)
+    return True
 
 class User:
     def __init__(self, name, email, phone):
@@ -25,59 +28,62 @@ class NotificationManager:
         self.notifications_sent = 0
     
     def notify_by_email(self, user, message):
-        # Uses EmailService temporarily - no permanent relationship
-        success = EmailService.send_email(user.email, "Notification", message)
+        # Uses send_email temporarily - no permanent relationship
+        success = send_email(user.email, "Notification", message)
         if success:
             self.notifications_sent += 1
     
     def notify_by_sms(self, user, message):
-        # Uses SMSService temporarily - no permanent relationship
-        success = SMSService.send_sms(user.phone, message)
+        # Uses send_sms temporarily - no permanent relationship
+        success = send_sms(user.phone, message)
         if success:
             self.notifications_sent += 1
 
-# DEPENDENCY: Calculator uses MathService temporarily
-class MathService:
-    @staticmethod
-    def calculate_tax(amount, rate):
-        return amount * (rate / 100)
-    
-    @staticmethod
-    def format_currency(amount):
-        return f"${amount:.2f}"
+# DEPENDENCY: Invoice uses math helpers temporarily
+# Pure functions, memoized since billing runs repeat the same (amount, rate) pairs
+@lru_cache(maxsize=4096)
+def calculate_tax(amount, rate):
+    return amount * (rate / 100)
+
+@lru_cache(maxsize=4096)
+def format_currency(amount):
+    return f"${amount:.2f}"
 
 class Invoice:
     def __init__(self, amount):
         self.amount = amount
     
     def calculate_total(self, tax_rate):
-        # Uses MathService temporarily - no permanent relationship
-        tax = MathService.calculate_tax(self.amount, tax_rate)
+        # Uses math helpers temporarily - no permanent relationship
+        tax = calculate_tax(self.amount, tax_rate)
         total = self.amount + tax
-        return MathService.format_currency(total)
+        return format_currency(total)
 
 # DEPENDENCY: FileProcessor uses different services based on file type
-class FileValidator:
-    @staticmethod
-    def validate_pdf(file_path):
-        return file_path.endswith('.pdf')
-    
-    @staticmethod
-    def validate_image(file_path):
-        return file_path.endswith(('.jpg', '.png', '.gif'))
+def validate_pdf(file_path):
+    return file_path.endswith('.pdf')
+
+def validate_image(file_path):
+    return file_path.endswith(('.jpg', '.png', '.gif'))
 
 class FileProcessor:
+    # file type -> (validator, label); a new type is a new entry, not a new branch
+    _HANDLERS = {
+        'pdf': (validate_pdf, 'PDF'),
+        'image': (validate_image, 'Image'),
+    }
+    
     def process_file(self, file_path, file_type):
         # Uses different services temporarily based on need
-        if file_type == 'pdf':
-            if FileValidator.validate_pdf(file_path):
-                print(f"Processing PDF: {file_path}")
-        elif file_type == 'image':
-            if FileValidator.validate_image(file_path):
-                print(f"Processing Image: {file_path}")
+        handler = self._HANDLERS.get(file_type)
+        if handler:
+            validate, label = handler
+            if validate(file_path):
+                log.info("Processing %s: %s", label, file_path)
         # No permanent relationships formed
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     # Semantic test: Service consumption without permanent relationships
     user = User("Alice", "alice@email.com", "+1234567890")
     notifier = NotificationManager()
@@ -88,7 +94,7 @@ if __name__ == '__main__':
     
     print(f"Notifications sent: {notifier.notifications_sent}")
     
-    # Invoice uses MathService temporarily
+    # Invoice uses math helpers temporarily
     invoice = Invoice(100.00)
     total = invoice.calculate_total(8.5)
     print(f"Invoice total: {total}")
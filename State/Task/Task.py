@@ -5,20 +5,34 @@ class Task:
     def __init__(self, name, assignee):
         self.name = name
         self.assignee = assignee
-        self.state: TaskState = IdleState()
+        self.set_state(IdleState.INSTANCE)
         print("Task has been created in idle state")
 
     def set_inprogress(self):
-        self.state.set_inprogress(self)
+        self._do_inprogress(self)
 
     def reopen_task(self):
-        self.state.reopen_task(self)
+        self._do_reopen(self)
 
     def done_task(self):
-        self.state.done_task(self)
+        self._do_done(self)
+
+    @property
+    def state(self) -> TaskState:
+        return self._state
+
+    @state.setter
+    def state(self, state: TaskState): #every assignment goes through here, so the cached handlers never go stale.
+        self._state = state
+        self._rebind()
 
     def set_state(self, state: TaskState):
         self.state = state
+
+    def _rebind(self): #caches the current state's handlers, so a transition call is a single call.
+        self._do_inprogress = self._state.set_inprogress
+        self._do_reopen = self._state.reopen_task
+        self._do_done = self._state.done_task
     
     def get_state(self):
-        return self.state
+        return self._state
@@ -1,4 +1,5 @@
 from .TaskState import TaskState
+from .TaskStatus import TaskStatus, TaskEvent
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,16 +11,20 @@ class ClosedState(TaskState):
         This is state when the task is closed.
     '''
 
+    status = TaskStatus.DONE
+    next_status = {TaskEvent.REOPEN: TaskStatus.OPEN}
+
     def set_inprogress(self, task: 'Task'):
         print("Can't set task in progress. please re-open it first.")
         return
 
     def reopen_task(self, task: 'Task'):
-        from .IdleState import IdleState
         print("Reopening the task.")
-        task.state = IdleState()
+        task.set_state(IdleState.INSTANCE)
 
     def done_task(self, task: 'Task'):
         print("No point of closing the closed task.")
 
-        
\ No newline at end of file
+ClosedState.INSTANCE = ClosedState()
+
+from .IdleState import IdleState
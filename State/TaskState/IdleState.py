@@ -1,4 +1,5 @@
 from .TaskState import TaskState
+from .TaskStatus import TaskStatus, TaskEvent
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -9,10 +10,12 @@ class IdleState(TaskState):
         This is the state when we create a new task. it will be in idlestate by default.
     '''
 
+    status = TaskStatus.OPEN
+    next_status = {TaskEvent.SET_INPROGRESS: TaskStatus.IN_PROGRESS}
+
     def set_inprogress(self, task: 'Task'):
-        from .ProgressState import ProgressState
         print("Setting the task in progress.")
-        task.state = ProgressState()
+        task.set_state(ProgressState.INSTANCE)
         
 
     def reopen_task(self, task: 'Task'):
@@ -20,6 +23,7 @@ class IdleState(TaskState):
 
     def done_task(self, task: 'Task'):
         print("Can't done a idle task. make it to inprogress first.")
-        
-        
-    
\ No newline at end of file
+
+IdleState.INSTANCE = IdleState()
+
+from .ProgressState import ProgressState
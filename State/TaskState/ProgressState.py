@@ -1,11 +1,14 @@
 from .TaskState import TaskState
+from .TaskStatus import TaskStatus, TaskEvent
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from Task import Task
 
 class ProgressState(TaskState):
-        
+
+    status = TaskStatus.IN_PROGRESS
+    next_status = {TaskEvent.DONE: TaskStatus.DONE}
 
     def set_inprogress(self, task: 'Task'):
         print("Already in progress. No point of making in progress again.")
@@ -14,7 +17,8 @@ class ProgressState(TaskState):
         print("Can't reopen an open task.")
 
     def done_task(self, task: 'Task'):
-        from .ClosedState import ClosedState
-        task.state = ClosedState()
+        task.set_state(ClosedState.INSTANCE)
+
+ProgressState.INSTANCE = ProgressState()
 
-    
\ No newline at end of file
+from .ClosedState import ClosedState
@@ -1,10 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 if TYPE_CHECKING:
     from Task import Task
+    from .TaskStatus import TaskStatus, TaskEvent
 
 class TaskState(ABC):
+    '''
+        Concrete states hold no per-task data, so each one is created once as X.INSTANCE and shared by every task.
+        Each state module imports the next state at the bottom, after its own class exists, because the
+        states reference each other in a cycle (Idle -> Progress -> Closed -> Idle).
+    '''
+
+    status: 'TaskStatus'
+    next_status: Dict['TaskEvent', 'TaskStatus'] #where each handler moves the task, kept next to the handlers it describes.
 
     @abstractmethod
     def set_inprogress(self, task: 'Task'):
@@ -0,0 +1,11 @@
+from enum import IntEnum
+
+class TaskStatus(IntEnum):
+    OPEN = 0
+    IN_PROGRESS = 1
+    DONE = 2
+
+class TaskEvent(IntEnum):
+    SET_INPROGRESS = 0
+    REOPEN = 1
+    DONE = 2
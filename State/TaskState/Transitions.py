@@ -0,0 +1,27 @@
+from .TaskStatus import TaskStatus, TaskEvent
+from .IdleState import IdleState
+from .ProgressState import ProgressState
+from .ClosedState import ClosedState
+
+_STATES = sorted((IdleState, ProgressState, ClosedState), key=lambda state: state.status) #indexed by TaskStatus
+
+#rows are the current status, columns the event. built from each state's next_status, an unlisted event keeps the status.
+TRANSITIONS = tuple(
+    tuple(state.next_status.get(event, state.status) for event in TaskEvent)
+    for state in _STATES
+)
+
+#one 256-byte translate table per event, so a whole batch is advanced in a single C-level pass.
+_EVENT_TABLES = tuple(
+    bytes(row[event] for row in TRANSITIONS) + bytes(range(len(TRANSITIONS), 256))
+    for event in TaskEvent
+)
+
+def advance(status: TaskStatus, event: TaskEvent) -> TaskStatus:
+    return TRANSITIONS[status][event]
+
+def advance_all(statuses: bytearray, event: TaskEvent) -> bytearray:
+    '''
+        Applies one event to many tasks. statuses holds one TaskStatus value per byte.
+    '''
+    return statuses.translate(_EVENT_TABLES[event])
@@ -1,5 +1,6 @@
 from .TaskState import TaskState
+from .TaskStatus import TaskStatus, TaskEvent
 from .IdleState import IdleState
 from .ClosedState import ClosedState
 from .ProgressState import ProgressState
-
+from .Transitions import TRANSITIONS, advance, advance_all
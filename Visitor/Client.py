@@ -1,5 +1,7 @@
-from Utils import DigitalProduct, PhysicalProduct
-from VisitorUtil import InvoiceVisitor, ShippingCostVisitor
+from Utils import DigitalProduct, PhysicalProduct, Product, ProductBatch
+from VisitorUtil import InvoiceVisitor, ShippingCostVisitor, CombinedVisitor
+
+verbose = False #set True to visit products one by one and print a line per product.
 
 if __name__ == '__main__':
     products = [
@@ -8,12 +10,25 @@ if __name__ == '__main__':
         PhysicalProduct("iPhone", 999.99, 0.3)
     ]
 
-    invoice_visitor = InvoiceVisitor()
-    shipping_cost_visitor = ShippingCostVisitor()
+    if verbose:
+        invoice_visitor = InvoiceVisitor.INSTANCE
+        shipping_cost_visitor = ShippingCostVisitor.INSTANCE
+        invoice_visitor.reset()
+        shipping_cost_visitor.reset()
+
+        physical_products = [p for p in products if isinstance(p, PhysicalProduct)] #digital products never ship, skip them for shipping.
+        Product.accept_all(products, invoice_visitor)
+        Product.accept_all(physical_products, shipping_cost_visitor)
+        invoice_visitor.flush()
+        shipping_cost_visitor.flush()
 
-    for product in products:
-        product.accept(invoice_visitor)
-        product.accept(shipping_cost_visitor)
+        invoice_total = invoice_visitor.get_total()
+        shipping_total = shipping_cost_visitor.get_total()
+    else:
+        totals_visitor = CombinedVisitor.INSTANCE #both totals in one pass over the batch.
+        totals_visitor.reset()
+        totals_visitor.visit_batch(ProductBatch(products))
+        invoice_total, shipping_total = totals_visitor.get_totals()
 
-    print(f"Invoice Total: ${invoice_visitor.get_total():.2f}")
-    print(f"Shipping Cost Total: ${shipping_cost_visitor.get_total():.2f}")
+    print(f"Invoice Total: ${invoice_total:.2f}")
+    print(f"Shipping Cost Total: ${shipping_total:.2f}")
@@ -1,14 +1,18 @@
-from .Product import Product
+from .Product import Product, intern_name, to_cents, TYPE_DIGITAL
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from VisitorUtil import Visitor
 
 class DigitalProduct(Product):
+
+    __slots__ = ('name', 'price_cents', 'file_name')
+
+    type_tag = TYPE_DIGITAL
     
     def __init__(self, name: str, price: float, file_name: str):
-        self.name = name
-        self.price = price
+        self.name = intern_name(name)
+        self.price_cents = to_cents(price)
         self.file_name = file_name
 
     def accept(self, visitor: 'Visitor'):
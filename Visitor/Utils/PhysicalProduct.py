@@ -1,14 +1,18 @@
-from .Product import Product
+from .Product import Product, intern_name, to_cents, TYPE_PHYSICAL
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from VisitorUtil import Visitor
 
 class PhysicalProduct(Product):
+
+    __slots__ = ('name', 'price_cents', 'weight')
+
+    type_tag = TYPE_PHYSICAL
     
     def __init__(self, name: str, price: float, weight: float):
-        self.name = name
-        self.price = price
+        self.name = intern_name(name)
+        self.price_cents = to_cents(price)
         self.weight = weight
 
     def accept(self, visitor: 'Visitor'):
@@ -1,11 +1,44 @@
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+import sys
+from decimal import Decimal, ROUND_HALF_UP
+from typing import TYPE_CHECKING, Iterable, List, Tuple
 
 if TYPE_CHECKING:
     from VisitorUtil import Visitor
 
-class Product(ABC):
+TYPE_DIGITAL = 0
+TYPE_PHYSICAL = 1
+
+def to_cents(price) -> int: #money is kept in whole cents, so totals are exact integer sums.
+    return int((Decimal(str(price)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def intern_name(name): #shared names are stored once, non-str names are kept as given.
+    return sys.intern(name) if isinstance(name, str) else name
+
+class Product():
+
+    __slots__ = ()
+
+    type_tag: int #TYPE_DIGITAL or TYPE_PHYSICAL, lets batch code tell products apart without isinstance.
+    price_cents: int
+
+    @property
+    def price(self) -> float: #derived from price_cents, so the two can never disagree.
+        return self.price_cents / 100
 
-    @abstractmethod
     def accept(self, visitor: 'Visitor'):
-        pass
+        raise NotImplementedError
+
+    @classmethod
+    def accept_all(cls, products: Iterable['Product'], visitor: 'Visitor'):
+        #products are bucketed by type_tag once, then each bucket runs a tight loop over one pre-bound visit method.
+        #all digital products are visited before the physical ones, not in list order.
+        buckets: Tuple[List['Product'], List['Product']] = ([], []) #indexed by TYPE_DIGITAL / TYPE_PHYSICAL
+        for product in products:
+            buckets[product.type_tag].append(product)
+
+        visit_digital = visitor.visit_digital_product
+        for product in buckets[TYPE_DIGITAL]:
+            visit_digital(product)
+        visit_physical = visitor.visit_physical_product
+        for product in buckets[TYPE_PHYSICAL]:
+            visit_physical(product)
@@ -0,0 +1,15 @@
+from array import array
+from typing import List
+from .Product import Product
+
+class ProductBatch():
+    '''
+        Structure-of-arrays view over a list of products. Visitors total a whole batch
+        with one reduction per column instead of one accept() call per product.
+    '''
+    
+    def __init__(self, products: List[Product]):
+        #columns are filled straight from generators, no temporary list of boxed values per column.
+        self.price_cents = array('q', (product.price_cents for product in products))
+        self.weights = array('d', (getattr(product, 'weight', 0.0) for product in products))
+        self.tags = array('b', (product.type_tag for product in products))
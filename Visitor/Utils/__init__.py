@@ -1,3 +1,4 @@
 from .PhysicalProduct import PhysicalProduct
 from .DigitalProduct import DigitalProduct
-from .Product import Product
\ No newline at end of file
+from .Product import Product, TYPE_DIGITAL, TYPE_PHYSICAL, to_cents
+from .ProductBatch import ProductBatch
@@ -0,0 +1,34 @@
+from .Visitor import Visitor
+from ._kernels import SHIPPING_RATE_PER_KG, totals
+
+class CombinedVisitor(Visitor):
+    '''
+        Invoice and shipping totals gathered in a single traversal, each product is visited once.
+    '''
+
+    __slots__ = ('invoice_cents', 'shipping_total')
+    
+    def __init__(self):
+        self.invoice_cents = 0
+        self.shipping_total = 0.0
+
+    def visit_digital_product(self, digital_product):
+        self.invoice_cents += digital_product.price_cents
+
+    def visit_physical_product(self, physical_product):
+        self.invoice_cents += physical_product.price_cents
+        self.shipping_total += physical_product.weight * SHIPPING_RATE_PER_KG
+
+    def visit_batch(self, batch):
+        invoice_cents, shipping_total = totals(batch.price_cents, batch.weights, batch.tags)
+        self.invoice_cents += invoice_cents
+        self.shipping_total += shipping_total
+    
+    def reset(self):
+        self.invoice_cents = 0
+        self.shipping_total = 0.0
+
+    def get_totals(self):
+        return self.invoice_cents / 100, self.shipping_total
+
+CombinedVisitor.INSTANCE = CombinedVisitor()
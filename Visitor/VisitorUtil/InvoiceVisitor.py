@@ -1,17 +1,39 @@
+import sys
+from typing import List
 from .Visitor import Visitor
 
 class InvoiceVisitor(Visitor):
+
+    __slots__ = ('total_cents', '_lines')
+
+    _DIGITAL_LINE = "Printing Invoice for Digital Product: %s - $%s" #%-templates, built once and filled per product.
+    _PHYSICAL_LINE = "Printing Invoice for Physical Product: %s - $%s"
     
     def __init__(self):
-        self.total = 0.0
+        self.total_cents = 0
+        self._lines: List[str] = [] #per product lines, written out together by flush().
 
     def visit_digital_product(self, digital_product):
-        print(f"Printing Invoice for Digital Product: {digital_product.name} - ${digital_product.price}")
-        self.total += digital_product.price
+        self._lines.append(self._DIGITAL_LINE % (digital_product.name, digital_product.price))
+        self.total_cents += digital_product.price_cents
 
     def visit_physical_product(self, physical_product):
-        print(f"Printing Invoice for Physical Product: {physical_product.name} - ${physical_product.price}")
-        self.total += physical_product.price
+        self._lines.append(self._PHYSICAL_LINE % (physical_product.name, physical_product.price))
+        self.total_cents += physical_product.price_cents
+
+    def visit_batch(self, batch):
+        self.total_cents += sum(batch.price_cents)
     
+    def reset(self):
+        self.total_cents = 0
+        self._lines.clear()
+
     def get_total(self):
-        return self.total
\ No newline at end of file
+        return self.total_cents / 100
+
+    def flush(self):
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+
+InvoiceVisitor.INSTANCE = InvoiceVisitor()
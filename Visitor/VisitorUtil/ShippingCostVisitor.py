@@ -1,19 +1,42 @@
+import sys
+from typing import List
 from .Visitor import Visitor
+from ._kernels import SHIPPING_RATE_PER_KG, shipping_total
 
 class ShippingCostVisitor(Visitor):
+
+    __slots__ = ('total', '_lines')
+
+    _DIGITAL_LINE = "Calculating Shipping Cost for Digital Product: %s - $%s"
+    _PHYSICAL_LINE = "Calculating Shipping Cost for Physical Product: %s - $%s"
     
     def __init__(self):
         self.total = 0.0
+        self._lines: List[str] = []
 
     def visit_digital_product(self, digital_product):
         cost = 0.0  # Digital products have no shipping cost
-        print(f"Calculating Shipping Cost for Digital Product: {digital_product.name} - ${cost}")
+        self._lines.append(self._DIGITAL_LINE % (digital_product.name, cost))
         self.total += cost
 
     def visit_physical_product(self, physical_product):
-        cost = physical_product.weight * 5.0  # $5 per kg
-        print(f"Calculating Shipping Cost for Physical Product: {physical_product.name} - ${cost}")
+        cost = physical_product.weight * SHIPPING_RATE_PER_KG
+        self._lines.append(self._PHYSICAL_LINE % (physical_product.name, cost))
         self.total += cost
+
+    def visit_batch(self, batch):
+        self.total += shipping_total(batch.weights, batch.tags)
     
+    def reset(self):
+        self.total = 0.0
+        self._lines.clear()
+
     def get_total(self):
-        return self.total
\ No newline at end of file
+        return self.total
+
+    def flush(self):
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+
+ShippingCostVisitor.INSTANCE = ShippingCostVisitor()
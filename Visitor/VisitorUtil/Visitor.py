@@ -1,16 +1,23 @@
-from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from Utils import PhysicalProduct, DigitalProduct
+    from Utils import PhysicalProduct, DigitalProduct, ProductBatch
 
-class Visitor(ABC):
+class Visitor():
+    '''
+        Plain base class rather than an ABC, so products and visitors are built without ABCMeta checks.
+        Subclasses override every visit method.
+        Concrete visitors also expose a shared INSTANCE, call its reset() before each run instead of building a new visitor.
+    '''
+
+    __slots__ = ()
 
-    @abstractmethod
     def visit_digital_product(self, product: 'DigitalProduct'):
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_physical_product(self, product: 'PhysicalProduct'):
-        pass
+        raise NotImplementedError
+
+    def visit_batch(self, batch: 'ProductBatch'):
+        raise NotImplementedError
     
\ No newline at end of file
@@ -1,3 +1,4 @@
 from .Visitor import Visitor
 from .InvoiceVisitor import InvoiceVisitor
 from .ShippingCostVisitor import ShippingCostVisitor
+from .CombinedVisitor import CombinedVisitor
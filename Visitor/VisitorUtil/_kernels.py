@@ -0,0 +1,15 @@
+from operator import mul
+from typing import Sequence, Tuple
+
+# Batch reductions shared by the visitors. They take plain numeric columns (see Utils.ProductBatch)
+# so the loop runs inside the builtin sum instead of one Python call per product.
+
+SHIPPING_RATE_PER_KG = 5.0
+
+def shipping_total(weights: Sequence[float], tags: Sequence[int]) -> float:
+    # tags are 0 (digital) or 1 (physical), multiplying masks out non-shippable weights without a branch
+    return sum(map(mul, weights, tags)) * SHIPPING_RATE_PER_KG
+
+def totals(price_cents: Sequence[int], weights: Sequence[float], tags: Sequence[int]) -> Tuple[int, float]:
+    # prices are whole cents, so the invoice sum is exact and independent of summation order
+    return sum(price_cents), shipping_total(weights, tags)